@@ -3,11 +3,11 @@ from __future__ import annotations
 import sys
 
 a = Analysis(
-    ["src/pyressetter/main.py"],
-    pathex=[],
+    ["run_ressetter.py"],
+    pathex=["src"],
     binaries=[],
     datas=[],
-    hiddenimports=["psutil"],
+    hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,7 @@
+"""Launcher for PyInstaller builds, kept outside the package so `ressetter` imports as a package."""
+
+from __future__ import annotations
+
+from ressetter.main import main
+
+main()
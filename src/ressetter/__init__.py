@@ -1,5 +1,28 @@
 from __future__ import annotations
 
-from ressetter.display_settings import DisplaySettings
-from ressetter.input_monitor import InputMonitor
-from ressetter.ressetter import ResSetter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ressetter.background_settings import BackgroundSettings
+    from ressetter.display_settings import DisplaySettings
+    from ressetter.input_monitor import InputMonitor
+    from ressetter.ressetter import ResSetter
+
+# Resolved on first access so importing the package (e.g. for config or --help) doesn't load the
+# Win32 and input hook modules until they're actually needed
+_LAZY_IMPORTS = {
+    "BackgroundSettings": "ressetter.background_settings",
+    "DisplaySettings": "ressetter.display_settings",
+    "InputMonitor": "ressetter.input_monitor",
+    "ResSetter": "ressetter.ressetter",
+}
+
+__all__ = ["BackgroundSettings", "DisplaySettings", "InputMonitor", "ResSetter"]
+
+
+def __getattr__(name: str) -> Any:
+    if module_name := _LAZY_IMPORTS.get(name):
+        return getattr(importlib.import_module(module_name), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
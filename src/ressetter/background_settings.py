@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class BackgroundSettings:
+    """Class to store timing settings for background mode."""
+
+    timeout: int = 300  # Seconds of inactivity before input triggers a display settings change
+    set_delay: int = 5  # Delay before setting display settings in seconds
+    retry_delay: int = 10  # Delay between retries in seconds
+    max_retries: int = 3  # Maximum number of retries to set display settings
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import tomllib
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import toml
 from polykit import PolyLog
 from polykit.env import PolyEnv
 from polykit.paths import PolyPath
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class Config:
     """Configuration manager for ResSetter."""
@@ -35,26 +39,16 @@ class Config:
         self.paths = PolyPath("ressetter")
         self.env = PolyEnv()
         self.env.add_var("RESSETTER_CONFIG", description="Path to the configuration file")
-        self.config_data = self.DEFAULT_CONFIG.copy()
+        self.config_data = copy.deepcopy(self.DEFAULT_CONFIG)
         self.load_config()
 
     def load_config(self) -> None:
-        """Load configuration from TOML file."""
-        config_paths = [
-            # Current directory
-            Path("config.toml"),
-            # User's home directory
-            self.paths.from_config("config.toml"),
-        ]
-
-        # Add config path from environment variable if set
-        if config_env := self.env.ressetter_config:
-            config_paths.insert(0, Path(config_env))
-
-        for config_path in config_paths:
-            if config_path.exists():
+        """Load configuration from the first readable TOML file found."""
+        for config_path in self._config_candidates():
+            if config_path.is_file():
                 try:
-                    loaded_config = toml.load(config_path)
+                    with config_path.open("rb") as f:
+                        loaded_config = tomllib.load(f)
                     self.logger.info("Loaded configuration from %s", config_path)
                     self._update_config(loaded_config)
                     return
@@ -63,6 +57,16 @@ class Config:
 
         self.logger.info("No configuration file found. Using default values.")
 
+    def _config_candidates(self) -> Iterator[Path]:
+        """Yield possible config file locations in priority order, built only as needed."""
+        # Config path from environment variable if set
+        if config_env := self.env.ressetter_config:
+            yield Path(config_env)
+        # Current directory
+        yield Path("config.toml")
+        # User's config directory
+        yield self.paths.from_config("config.toml")
+
     def _update_config(self, loaded_config: dict[str, Any]) -> None:
         """Update configuration with loaded values."""
         # Update display settings if present
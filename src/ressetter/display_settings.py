@@ -3,9 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-import win32api  # type: ignore
-import win32con  # type: ignore
 from polykit import PolyLog
+from win32api import ChangeDisplaySettings, EnumDisplaySettings  # type: ignore
+from win32con import (  # type: ignore
+    DISP_CHANGE_SUCCESSFUL,
+    DM_DISPLAYFREQUENCY,
+    DM_PELSHEIGHT,
+    DM_PELSWIDTH,
+    ENUM_CURRENT_SETTINGS,
+)
 
 if TYPE_CHECKING:
     from logging import Logger
@@ -13,33 +19,78 @@ if TYPE_CHECKING:
     import win32typing  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplaySettings:
     """Class to store and manage display settings."""
 
     width: int = 3840
     height: int = 2160
     refresh_rate: int = 120
-    devmode: win32typing.PyDEVMODEW = field(init=False)
     logger: Logger = field(init=False)
 
     def __post_init__(self):
-        self.devmode = win32api.EnumDisplaySettings(None, win32con.ENUM_CURRENT_SETTINGS)
         self.logger = PolyLog().get_logger()
 
+    def apply_if_needed(self) -> bool:
+        """Set the display settings only if they don't already match the desired settings.
+
+        Returns:
+            True if the display is at the desired settings afterward, False otherwise.
+        """
+        devmode = self._read_current()
+        if self._matches(devmode):
+            self._log_already_set()
+            return True
+        return self._change_to(devmode)
+
     def set_display_settings(self) -> bool:
         """Set the display resolution and refresh rate for the primary display.
 
         Returns:
             True if the display settings were set successfully, False otherwise.
         """
-        self.devmode.PelsWidth = self.width
-        self.devmode.PelsHeight = self.height
-        self.devmode.DisplayFrequency = self.refresh_rate
+        return self._change_to(self._read_current())
+
+    @property
+    def already_set_correctly(self) -> bool:
+        """Check to see if the current display settings already match the desired settings.
+
+        Returns:
+            True if the display settings match the desired settings, False otherwise.
+        """
+        if self._matches(self._read_current()):
+            self._log_already_set()
+            return True
+        return False
+
+    def _read_current(self) -> win32typing.PyDEVMODEW:
+        """Query the current settings for the primary display.
+
+        This is read fresh every time so changes made outside the script (e.g. a TV dropping back
+        to 60 Hz after being turned off) are always noticed.
+        """
+        return EnumDisplaySettings(None, ENUM_CURRENT_SETTINGS)
+
+    def _matches(self, devmode: win32typing.PyDEVMODEW) -> bool:
+        """Check whether the given display mode matches the desired settings."""
+        return (
+            devmode.PelsWidth == self.width
+            and devmode.PelsHeight == self.height
+            and devmode.DisplayFrequency == self.refresh_rate
+        )
+
+    def _change_to(self, devmode: win32typing.PyDEVMODEW) -> bool:
+        """Update the given display mode to the desired settings and apply it."""
+        devmode.PelsWidth = self.width
+        devmode.PelsHeight = self.height
+        devmode.DisplayFrequency = self.refresh_rate
+
+        # Some drivers reject the mode with DISP_CHANGE_BADMODE unless the fields are flagged
+        devmode.Fields = DM_PELSWIDTH | DM_PELSHEIGHT | DM_DISPLAYFREQUENCY
 
         try:
-            change_result = win32api.ChangeDisplaySettings(self.devmode, 0)
-            if change_result == win32con.DISP_CHANGE_SUCCESSFUL:
+            change_result = ChangeDisplaySettings(devmode, 0)
+            if change_result == DISP_CHANGE_SUCCESSFUL:
                 self.logger.info(
                     "Display set to %sx%s and %s Hz successfully.",
                     self.width,
@@ -53,23 +104,11 @@ class DisplaySettings:
             self.logger.exception("Exception occurred: %s", str(e))
             return False
 
-    @property
-    def already_set_correctly(self) -> bool:
-        """Check to see if the current display settings already match the desired settings.
-
-        Returns:
-            True if the display settings match the desired settings, False otherwise.
-        """
-        if (
-            self.devmode.PelsWidth == self.width
-            and self.devmode.PelsHeight == self.height
-            and self.devmode.DisplayFrequency == self.refresh_rate
-        ):
-            self.logger.info(
-                "Display is already set to %sx%s at %s Hz.",
-                self.width,
-                self.height,
-                self.refresh_rate,
-            )
-            return True
-        return False
+    def _log_already_set(self) -> None:
+        """Log that the display is already at the desired settings."""
+        self.logger.info(
+            "Display is already set to %sx%s at %s Hz.",
+            self.width,
+            self.height,
+            self.refresh_rate,
+        )
@@ -1,91 +1,141 @@
 from __future__ import annotations
 
+import ctypes
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from polykit import PolyLog
-from pynput import keyboard, mouse
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from logging import Logger
 
+    from pynput import keyboard, mouse
+
+    from ressetter.background_settings import BackgroundSettings
     from ressetter.display_settings import DisplaySettings
 
+NS_PER_SECOND = 1_000_000_000
+
+_winmm = ctypes.WinDLL("winmm")  # type: ignore
+_winmm.timeBeginPeriod.argtypes = [ctypes.c_uint]
+_winmm.timeEndPeriod.argtypes = [ctypes.c_uint]
+
+
+@contextmanager
+def timer_resolution(period_ms: int) -> Iterator[None]:
+    """Temporarily raise the Windows timer resolution so short waits don't overshoot.
 
-@dataclass
+    This has a system-wide power cost, so only hold it around the waits that need it.
+    """
+    _winmm.timeBeginPeriod(period_ms)
+    try:
+        yield
+    finally:
+        _winmm.timeEndPeriod(period_ms)
+
+
+@dataclass(slots=True)
 class InputMonitor:
     """Monitor for keyboard and mouse input to set display settings after a period of inactivity."""
 
     display_settings: DisplaySettings
-    timeout: int  # Timeout in seconds
-    set_delay: int  # Delay before setting display settings in seconds
-    retry_delay: int  # Delay between retries in seconds
-    max_retries: int  # Maximum number of retries to set display settings
+    settings: BackgroundSettings
 
-    keyboard_listener: keyboard.Listener = field(init=False)
-    mouse_listener: mouse.Listener = field(init=False)
+    keyboard_listener: keyboard.Listener | None = field(init=False, default=None)
+    mouse_listener: mouse.Listener | None = field(init=False, default=None)
 
-    timer: threading.Timer | None = None
-    last_activity_time: float = field(default_factory=time.time)
+    watcher: threading.Thread = field(init=False)
+    timeout_ns: int = field(init=False)
+    last_activity_time: int = field(default_factory=time.monotonic_ns)
+    inactive: bool = False
+    wake_event: threading.Event = field(default_factory=threading.Event)
+    stop_event: threading.Event = field(default_factory=threading.Event)
 
     logger: Logger = field(init=False)
 
     def __post_init__(self):
-        self.keyboard_listener = keyboard.Listener(on_press=self.on_activity)
-        self.mouse_listener = mouse.Listener(on_move=self.on_activity, on_click=self.on_activity)
+        self.timeout_ns = self.settings.timeout * NS_PER_SECOND
+        self.watcher = threading.Thread(target=self.watch_inactivity, daemon=True)
         self.logger = PolyLog().get_logger()
 
     def start(self) -> None:
         """Start monitoring for keyboard and mouse input."""
+        # Imported here so one-shot runs don't pay for loading pynput and its input hooks
+        from pynput import keyboard, mouse
+
+        self.keyboard_listener = keyboard.Listener(on_press=self.on_activity)
+        self.mouse_listener = mouse.Listener(on_move=self.on_activity, on_click=self.on_activity)
         self.keyboard_listener.start()
         self.mouse_listener.start()
-        self.reset_timer()
+        self.watcher.start()
 
     def stop(self) -> None:
         """Stop monitoring for keyboard and mouse input."""
-        self.keyboard_listener.stop()
-        self.mouse_listener.stop()
-        if self.timer:
-            self.timer.cancel()
+        if self.keyboard_listener:
+            self.keyboard_listener.stop()
+        if self.mouse_listener:
+            self.mouse_listener.stop()
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def join(self) -> None:
+        """Block until monitoring is stopped."""
+        self.stop_event.wait()
 
     def on_activity(self, *args: Any) -> None:  # noqa: ARG002
-        """Reset the inactivity timer when keyboard or mouse activity is detected."""
-        current_time = time.time()
-        if current_time - self.last_activity_time >= self.timeout:
-            threading.Timer(self.set_delay, self.attempt_display_settings_change).start()
-        self.last_activity_time = current_time
-        self.reset_timer()
-
-    def reset_timer(self) -> None:
-        """Reset the inactivity timer."""
-        if self.timer:
-            self.timer.cancel()
-        self.timer = threading.Timer(self.timeout, self.on_inactivity)
-        self.timer.start()
+        """Record keyboard or mouse activity, waking the watcher if the user was inactive.
+
+        This runs in pynput's input hook for every key press and mouse move, so it does as little
+        as possible. Timing and display changes are handled on the watcher thread.
+        """
+        self.last_activity_time = time.monotonic_ns()
+        if self.inactive:
+            self.inactive = False
+            self.wake_event.set()
+
+    def watch_inactivity(self) -> None:
+        """Wait for a period of inactivity, then set display settings once input resumes.
+
+        All of the monitor's timing runs on this one thread, so no timer threads are created.
+        """
+        while not self.stop_event.is_set():
+            remaining_ns = self.last_activity_time + self.timeout_ns - time.monotonic_ns()
+            if remaining_ns > 0:
+                self.wake_event.wait(remaining_ns / NS_PER_SECOND)
+                self.wake_event.clear()
+                continue
+
+            self.on_inactivity()
+            self.wake_event.wait()
+            self.wake_event.clear()
+
+            with timer_resolution(1):
+                if not self.stop_event.wait(self.settings.set_delay):
+                    self.attempt_display_settings_change()
 
     def on_inactivity(self) -> None:
-        """Print a message when inactivity is detected."""
+        """Mark the user as inactive so the next input triggers a display settings change."""
+        self.inactive = True
         self.logger.debug("Inactivity detected. Waiting for next input to set display settings.")
 
     def attempt_display_settings_change(self) -> None:
         """Attempt to change display settings with retries."""
-        for attempt in range(self.max_retries):
-            if self.display_settings.already_set_correctly:
-                self.logger.info("Display settings are already correct.")
-                return
-
-            if self.display_settings.set_display_settings():
-                self.logger.info(
-                    "Display settings changed successfully on attempt %s.", attempt + 1
-                )
+        for attempt in range(self.settings.max_retries):
+            if self.display_settings.apply_if_needed():
                 return
 
-            if attempt < self.max_retries - 1:
+            if attempt < self.settings.max_retries - 1:
                 self.logger.warning(
-                    "Failed to change display settings. Retrying in %s seconds.", self.retry_delay
+                    "Failed to change display settings. Retrying in %s seconds.",
+                    self.settings.retry_delay,
                 )
-                time.sleep(self.retry_delay)
+                if self.stop_event.wait(self.settings.retry_delay):
+                    return
 
-        self.logger.error("Failed to change display settings after %s attempts.", self.max_retries)
+        self.logger.error(
+            "Failed to change display settings after %s attempts.", self.settings.max_retries
+        )
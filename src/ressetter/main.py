@@ -4,81 +4,75 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import cache
 
-from polykit import PolyLog
 from polykit.cli import PolyArgs
 
-from ressetter import DisplaySettings, ResSetter
 from ressetter.config import config
 
-logger = PolyLog().get_logger()
+# Flag, config section, config key, and help text for each option that takes a value
+ARG_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    ("--width", "display", "width", "width of the display resolution"),
+    ("--height", "display", "height", "height of the display resolution"),
+    ("--refresh", "display", "refresh_rate", "refresh rate of the display in Hz"),
+    ("--timeout", "background", "timeout", "timeout in seconds for background mode"),
+    ("--set-delay", "background", "set_delay", "seconds before attempting to set display"),
+    ("--retry-delay", "background", "retry_delay", "seconds between retries"),
+    ("--max-retries", "background", "max_retries", "maximum number of retries"),
+)
 
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments, using config values as defaults."""
-    parser = argparse.ArgumentParser(description="Set display resolution and refresh rate.")
-    parser.add_argument(
-        "--width",
-        type=int,
-        default=config.display["width"],
-        help=f"width of the display resolution (default: {config.display['width']})",
-    )
-    parser.add_argument(
-        "--height",
-        type=int,
-        default=config.display["height"],
-        help=f"weight of the display resolution (default: {config.display['height']})",
-    )
-    parser.add_argument(
-        "--refresh",
-        type=int,
-        default=config.display["refresh_rate"],
-        help=f"refresh rate of the display in Hz (default: {config.display['refresh_rate']})",
-    )
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        default=config.background["timeout"],
-        help=f"timeout in seconds for background mode (default: {config.background['timeout']})",
-    )
-    parser.add_argument(
-        "--set-delay",
-        type=int,
-        default=config.background["set_delay"],
-        help=f"seconds before attempting to set display (default: {config.background['set_delay']})",
-    )
-    parser.add_argument(
-        "--retry-delay",
-        type=int,
-        default=config.background["retry_delay"],
-        help=f"seconds between retries (default: {config.background['retry_delay']})",
-    )
-    parser.add_argument(
-        "--max-retries",
-        type=int,
-        default=config.background["max_retries"],
-        help=f"maximum number of retries (default: {config.background['max_retries']})",
-    )
+    # Skip building the parser for the usual shortcut and startup launches (no arguments, or just
+    # --background), since every value then comes straight from the config
+    if set(sys.argv[1:]) <= {"--background"}:
+        defaults = {
+            flag.removeprefix("--").replace("-", "_"): config.config_data[section][key]
+            for flag, section, key, _ in ARG_SPECS
+        }
+        return argparse.Namespace(**defaults, background="--background" in sys.argv)
+
+    return _build_parser().parse_args()
+
+
+@cache
+def _build_parser() -> PolyArgs:
+    """Build the command-line parser once, using config values as defaults."""
+    parser = PolyArgs(description=__doc__, arg_width=24, max_width=120)
+    for flag, section, key, help_text in ARG_SPECS:
+        parser.add_argument(
+            flag,
+            type=int,
+            default=config.config_data[section][key],
+            help=f"{help_text} (default: %(default)s)",
+        )
     parser.add_argument("--background", action="store_true", help="run in background mode")
-    return parser.parse_args()
+    return parser
 
 
 def main() -> None:
     """Set the display settings if needed, or run in background mode."""
-    parser = PolyArgs(description=__doc__, arg_width=24, max_width=120)
-    args = parser.parse_args()
+    args = parse_args()
 
-    display = DisplaySettings(args.width, args.height, args.refresh)
-    ressetter = ResSetter(display, args.timeout, args.set_delay, args.retry_delay, args.max_retries)
+    # Import directly from the submodules so one-shot runs load only what they use, and so
+    # PyInstaller can see the imports (it can't follow the package's lazy re-exports)
+    from ressetter.display_settings import DisplaySettings
+
+    if not args.background:
+        DisplaySettings(args.width, args.height, args.refresh).apply_if_needed()
+        return
 
-    if args.background and ressetter.already_running:
-        ressetter.show_message_box("An instance of this script is already running.", "4K120")
+    from ressetter.background_settings import BackgroundSettings
+    from ressetter.ressetter import ResSetter
+
+    if ResSetter.is_another_instance_running():
+        ResSetter.show_message_box("An instance of this script is already running.", "4K120")
         sys.exit(0)
 
-    if args.background:
-        ressetter.run_background()
-    elif not display.already_set_correctly:
-        display.set_display_settings()
+    display = DisplaySettings(args.width, args.height, args.refresh)
+    settings = BackgroundSettings(args.timeout, args.set_delay, args.retry_delay, args.max_retries)
+    ResSetter(display, settings).run_background()
 
 
 if __name__ == "__main__":
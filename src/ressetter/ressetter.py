@@ -2,90 +2,134 @@
 
 from __future__ import annotations
 
-import atexit
 import ctypes
-import os
-import tempfile
-import time
+import threading
+from ctypes import wintypes
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-import psutil
+import win32api  # type: ignore
 from polykit import PolyLog
+from win32con import CTRL_CLOSE_EVENT, CTRL_LOGOFF_EVENT, CTRL_SHUTDOWN_EVENT  # type: ignore
 
-from ressetter import DisplaySettings, InputMonitor
+from ressetter.input_monitor import InputMonitor
 
 if TYPE_CHECKING:
     from logging import Logger
 
+    from ressetter.background_settings import BackgroundSettings
+    from ressetter.display_settings import DisplaySettings
+
+ERROR_ACCESS_DENIED = 5
+ERROR_ALREADY_EXISTS = 183
+MUTEX_NAME = "Global\\ResSetter"
+MESSAGE_BOX_CLASS = "#32770"  # Window class Windows uses for dialog boxes
+
+# Windows ends the process when the handler returns for these, and only waits about 5 seconds
+TERMINATING_CONSOLE_EVENTS = {CTRL_CLOSE_EVENT, CTRL_LOGOFF_EVENT, CTRL_SHUTDOWN_EVENT}
+CLEANUP_TIMEOUT = 4
+
+# Bind Win32 functions once with explicit signatures so ctypes doesn't infer them on every call
+_CreateMutexW = ctypes.WinDLL("kernel32", use_last_error=True).CreateMutexW  # type: ignore
+_CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+_CreateMutexW.restype = wintypes.HANDLE
+
+_user32 = ctypes.WinDLL("user32")  # type: ignore
+
+_MessageBoxW = _user32.MessageBoxW
+_MessageBoxW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.UINT]
+_MessageBoxW.restype = ctypes.c_int
+
+_FindWindowW = _user32.FindWindowW
+_FindWindowW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR]
+_FindWindowW.restype = wintypes.HWND
+
+_SetForegroundWindow = _user32.SetForegroundWindow
+_SetForegroundWindow.argtypes = [wintypes.HWND]
+_SetForegroundWindow.restype = wintypes.BOOL
+
 
 @dataclass
 class ResSetter:
     """Main class for the ResSetter script."""
 
     display: DisplaySettings
-    timeout: int
-    set_delay: int
-    retry_delay: int
-    max_retries: int
+    settings: BackgroundSettings
 
     logger: Logger = field(init=False)
+    cleanup_done: threading.Event = field(init=False, default_factory=threading.Event)
+
+    # Held for the lifetime of the process so other instances can see this one is running
+    instance_mutex: ClassVar[int | None] = None
 
     def __post_init__(self) -> None:
         self.logger = PolyLog().get_logger()
-        self.monitor = InputMonitor(
-            self.display, self.timeout, self.set_delay, self.retry_delay, self.max_retries
-        )
+        self.monitor = InputMonitor(self.display, self.settings)
 
     def run_background(self) -> None:
         """Run the script in background mode, monitoring for inactivity to set display settings."""
         try:
+            win32api.SetConsoleCtrlHandler(self.on_console_event, True)
             self.monitor.start()
-            timeout_minutes = self.timeout // 60  # Convert seconds to minutes for display
+            timeout_minutes = self.settings.timeout // 60  # Convert seconds to minutes for display
             self.logger.info("Running in background mode, monitoring input.")
             self.logger.info(
                 "Will set display settings after %d minutes of inactivity.", timeout_minutes
             )
             self.logger.debug(
                 "Delay before set after inactivity: %d %s, delay before retrying: %d %s, max retries: %d",
-                self.set_delay,
-                "second" if self.set_delay == 1 else "seconds",
-                self.retry_delay,
-                "second" if self.retry_delay == 1 else "seconds",
-                self.max_retries,
+                self.settings.set_delay,
+                "second" if self.settings.set_delay == 1 else "seconds",
+                self.settings.retry_delay,
+                "second" if self.settings.retry_delay == 1 else "seconds",
+                self.settings.max_retries,
             )
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.logger.info("Stopping input monitoring.")
+            self.monitor.join()
         finally:
             self.monitor.stop()
+            self.cleanup_done.set()
+            win32api.SetConsoleCtrlHandler(self.on_console_event, False)
 
-    @property
-    def already_running(self) -> bool:
-        """Check if the script is already running using a file-based lock."""
-        lock_file = Path(tempfile.gettempdir()) / "DisplaySettingsScript.lock"
-        try:
-            # Check if the process with the stored PID is still running
-            if lock_file.exists():
-                with lock_file.open() as f:
-                    pid = int(f.read().strip())
-                if psutil.pid_exists(pid):
-                    return True  # Process is still running
-
-            # Create new lock file with our PID
-            with lock_file.open("w") as f:
-                f.write(str(os.getpid()))
-
-            # Register function to remove lock file on script exit
-            atexit.register(lambda: lock_file.unlink(missing_ok=True))
-            return False
-        except Exception as e:
-            self.logger.error("Error checking/creating lock file: %s", str(e))
+    def on_console_event(self, event: int) -> bool:
+        """Stop monitoring on Ctrl+C, console close, logoff, or shutdown.
+
+        Python signal handlers only run on the main thread, which is blocked waiting on the monitor,
+        so console events are handled here (on their own thread) by releasing that wait instead.
+        For events where Windows ends the process as soon as this returns, wait for cleanup first.
+        """
+        self.logger.info("Stopping input monitoring.")
+        self.monitor.stop_event.set()
+        if event in TERMINATING_CONSOLE_EVENTS:
+            self.cleanup_done.wait(CLEANUP_TIMEOUT)
+        return True
+
+    @classmethod
+    def is_another_instance_running(cls) -> bool:
+        """Check if another instance is already running using a named mutex.
+
+        This doesn't need an instance, so it can run before any display settings are set up. The
+        mutex handle is held for the lifetime of the process and released by the OS on exit.
+        """
+        cls.instance_mutex = _CreateMutexW(None, True, MUTEX_NAME)
+        err = ctypes.get_last_error()  # type: ignore
+
+        if not cls.instance_mutex:
+            # An elevated instance's mutex can't be opened from a non-elevated launch, but it exists
+            if err == ERROR_ACCESS_DENIED:
+                return True
+            PolyLog().get_logger().error("Error creating instance mutex: %s", err)
             return False
 
+        return err == ERROR_ALREADY_EXISTS
+
     @staticmethod
     def show_message_box(message: str, title: str) -> None:
-        """Display a Windows message box with the given message and title."""
-        ctypes.windll.user32.MessageBoxW(0, message, title, 0)  # type: ignore
+        """Display a Windows message box with the given message and title.
+
+        If a message box with the same title is already open, it's brought to the front instead of
+        stacking up another one.
+        """
+        if hwnd := _FindWindowW(MESSAGE_BOX_CLASS, title):
+            _SetForegroundWindow(hwnd)
+            return
+        _MessageBoxW(None, message, title, 0)